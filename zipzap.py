@@ -4,15 +4,24 @@ import os
 import sys
 import zipfile
 import logging
+import logging.handlers
 import json
+import sqlite3
 import hashlib
 import threading
 import multiprocessing
 import time
 import errno
+import shutil
+import contextlib
+import struct
+import zlib
+import re
+import heapq
+import itertools
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 try:
     import tkinter as tk
@@ -21,64 +30,175 @@ try:
 except ImportError:
     GUI_AVAILABLE = False
 
+try:
+    import deflate
+    DEFLATE_AVAILABLE = True
+except ImportError:
+    DEFLATE_AVAILABLE = False
+
+# Buffer size used when copying decompressed member data to disk
+EXTRACT_BUF = 1 << 20
+
+# DEFLATE members smaller than this are decompressed in one shot with libdeflate when available
+ONESHOT_MAX_SIZE = 2 << 20
+
+# Largest read buffer kept alive per thread between members
+READ_BUFFER_MAX = max(EXTRACT_BUF, ONESHOT_MAX_SIZE)
+
+# Zips are extracted into a hidden '.<name>.<random>.zipzap-staging' sibling and renamed
+# into place, see staged_extract_dir. Only directories matching this pattern are ever removed.
+STAGING_SUFFIX = '.zipzap-staging'
+STAGING_DIR_PATTERN = re.compile(r'\..+\.[0-9a-f]{8}' + re.escape(STAGING_SUFFIX) + r'\Z')
+
+# Upper bound on threads used to extract members of a single zip in parallel
+INTRA_ZIP_MAX_THREADS = 8
+
+# Zips above this size are reported as large
+LARGE_ZIP_MIN_MB = 10
+
+# Zips with more members than this, averaging under INTRA_ZIP_MAX_AVG_FILE_SIZE, are extracted with threads
+INTRA_ZIP_MIN_MEMBERS = 16
+INTRA_ZIP_MAX_AVG_FILE_SIZE = 4 * 1024 * 1024
+
+# Log records buffered before being written to zipzap.log, see setup_logging
+LOG_BUFFER_CAPACITY = 1024
+
+# Bound on in-flight work items per worker, see _scan_directory_hybrid
+PENDING_FUTURES_PER_WORKER = 4
+
+# Default concurrency by storage type, see _probe_io_parallelism
+HDD_IO_PARALLELISM = 4
+SSD_IO_PARALLELISM = 8
+NETWORK_IO_PARALLELISM = 16
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', '9p', 'afs', 'ceph', 'glusterfs', 'fuse.sshfs'}
+
+COPY_FILE_RANGE_AVAILABLE = hasattr(os, 'copy_file_range')
+PREAD_AVAILABLE = hasattr(os, 'pread') and hasattr(os, 'preadv')
+FADVISE_AVAILABLE = hasattr(os, 'posix_fadvise')
+# copy_file_range failures that mean "not supported here" rather than a real error
+COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL}
+
+# Per-thread buffers reused across member reads, see get_read_buffer
+_read_buffers = threading.local()
+
+LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+LOCAL_HEADER_SIGNATURE = 0x04034b50
+
 class ProgressTracker:
+    """Records processed zips in a SQLite database so lookups and appends never rewrite the whole store."""
+
     def __init__(self, progress_file='zipzap_progress.json'):
+        # progress_file names the JSON store used by older versions, migrated on first load
         self.progress_file = progress_file
-        self.processed_files = set()
-        self.pending_saves = set()
+        self.log_file = progress_file + '.log'
+        self.db_file = str(Path(progress_file).with_suffix('.db'))
+        self.has_legacy_hashes = False
+        self._lock = threading.Lock()
+        self._conn = None
         self.load_progress()
 
     def load_progress(self):
+        # The GUI creates the tracker on the main thread and uses it from the extraction thread
+        self._conn = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS processed (path TEXT PRIMARY KEY)")
+        self._migrate_json_progress()
+
+        # Progress files written by older versions store MD5 hashes of the path
+        self.has_legacy_hashes = self._conn.execute(
+            "SELECT 1 FROM processed WHERE length(path) = 32 AND path NOT GLOB '*[^0-9a-f]*' LIMIT 1"
+        ).fetchone() is not None
+
+        processed_count = self.processed_count()
+        if processed_count:
+            logging.info(f"Loaded progress: {processed_count} files already processed")
+
+    def _migrate_json_progress(self):
+        """Import the JSON snapshot and append log written by older versions, then remove them."""
+        entries = []
+
         if Path(self.progress_file).exists():
             try:
                 with open(self.progress_file, 'r') as f:
-                    data = json.load(f)
-                    self.processed_files = set(data.get('processed_files', []))
-                    if self.processed_files:
-                        last_updated = data.get('last_updated', 'unknown')
-                        logging.info(f"Loaded progress: {len(self.processed_files)} files already processed (last updated: {last_updated})")
+                    entries.extend(json.load(f).get('processed_files', []))
             except (json.JSONDecodeError, FileNotFoundError):
-                self.processed_files = set()
-        else:
-            self.processed_files = set()
+                pass
 
-    def save_progress(self):
-        with open(self.progress_file, 'w') as f:
-            json.dump({
-                'processed_files': list(self.processed_files),
-                'last_updated': datetime.now().isoformat()
-            }, f, indent=2)
+        if Path(self.log_file).exists():
+            with open(self.log_file, 'r') as f:
+                entries.extend(line.rstrip('\n') for line in f if line.strip())
+
+        if not entries:
+            return
+
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("INSERT OR IGNORE INTO processed (path) VALUES (?)", ((e,) for e in entries))
+        logging.info(f"Migrated {len(entries)} progress entries to {self.db_file}")
+
+        for path in (self.progress_file, self.log_file):
+            Path(path).unlink(missing_ok=True)
+
+    def processed_count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
 
     def is_processed(self, file_path):
-        file_hash = self.get_file_hash(file_path)
-        return file_hash in self.processed_files
+        keys = [self.get_file_key(file_path)]
+        if self.has_legacy_hashes:
+            keys.append(self.get_legacy_hash(file_path))
+
+        with self._lock:
+            for key in keys:
+                if self._conn.execute("SELECT 1 FROM processed WHERE path = ? LIMIT 1", (key,)).fetchone():
+                    return True
+        return False
 
     def mark_processed(self, file_path):
-        file_hash = self.get_file_hash(file_path)
-        self.processed_files.add(file_hash)
-        self.pending_saves.add(file_hash)
+        with self._lock:
+            self._conn.execute("INSERT OR IGNORE INTO processed (path) VALUES (?)", (self.get_file_key(file_path),))
 
     def batch_save_progress(self):
-        if self.pending_saves:
-            self.save_progress()
-            self.pending_saves.clear()
+        # Every mark_processed is already committed to the WAL; kept for callers that checkpoint
+        pass
+
+    def get_file_key(self, file_path):
+        return os.path.abspath(file_path)
 
-    def get_file_hash(self, file_path):
-        return hashlib.md5(str(file_path).encode()).hexdigest()
+    @staticmethod
+    def get_legacy_hash(file_path):
+        # Only matches entries from older progress files; not a security use of MD5
+        return hashlib.md5(os.fspath(file_path).encode(), usedforsecurity=False).hexdigest()
 
     def clear_progress(self):
-        self.processed_files.clear()
-        self.pending_saves.clear()
-        if Path(self.progress_file).exists():
-            Path(self.progress_file).unlink()
+        with self._lock:
+            self._conn.execute("DELETE FROM processed")
+        self.has_legacy_hashes = False
+        for path in (self.progress_file, self.log_file):
+            if Path(path).exists():
+                Path(path).unlink()
+
+def setup_logging(buffered=True):
+    """Log to the console and zipzap.log.
+
+    File records are buffered and written LOG_BUFFER_CAPACITY at a time, or immediately on
+    errors. Worker processes exit without running logging's shutdown flush, so they pass
+    buffered=False.
+    """
+    log_format = '%(asctime)s - %(levelname)s - %(message)s'
+    file_handler = logging.FileHandler('zipzap.log')
+    if buffered:
+        # basicConfig only formats the handlers it is given, not a MemoryHandler's target
+        file_handler.setFormatter(logging.Formatter(log_format))
+        file_handler = logging.handlers.MemoryHandler(LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler)
 
-def setup_logging():
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler('zipzap.log')
+            file_handler
         ]
     )
 
@@ -149,27 +269,253 @@ def retry_on_network_error(func, *args, max_retries=3, initial_delay=1.0, backof
 
     raise last_exception
 
-def extract_single_file_from_zip(args):
-    """Extract a single file from a zip archive - used for intra-zip parallelization."""
-    zip_path_str, member_info, extract_dir_str = args
+def _use_pread(raw_lock):
+    """Threads sharing a handle read it with positioned reads, which need no lock."""
+    return raw_lock is not None and PREAD_AVAILABLE
 
-    def _do_extract():
-        extract_dir = Path(extract_dir_str)
-        target_path = extract_dir / member_info['filename']
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+def _member_data_offset(raw_file, member, raw_lock=None):
+    """Return the archive offset of member's data, just past its local header."""
+    if _use_pread(raw_lock):
+        header = os.pread(raw_file.fileno(), LOCAL_HEADER.size, member.header_offset)
+    else:
+        with raw_lock or contextlib.nullcontext():
+            raw_file.seek(member.header_offset)
+            header = raw_file.read(LOCAL_HEADER.size)
+    if len(header) != LOCAL_HEADER.size:
+        raise zipfile.BadZipFile(f"Truncated local header for {member.filename}")
+
+    fields = LOCAL_HEADER.unpack(header)
+    if fields[0] != LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local header signature for {member.filename}")
+
+    # Skip the variable-length filename and extra fields
+    return member.header_offset + LOCAL_HEADER.size + fields[9] + fields[10]
+
+def get_read_buffer(size):
+    """Return this thread's reusable read buffer, grown to at least size bytes.
+
+    Requests above READ_BUFFER_MAX get a one-off buffer so a thread never keeps more than that alive.
+    """
+    if size > READ_BUFFER_MAX:
+        return bytearray(size)
+    buf = getattr(_read_buffers, 'buf', None)
+    if buf is None or len(buf) < size:
+        buf = _read_buffers.buf = bytearray(max(size, EXTRACT_BUF))
+    return buf
+
+def read_member_raw(raw_file, member, raw_lock=None):
+    """Read the compressed bytes of a member straight from the archive file.
+
+    Returns a view into the calling thread's read buffer, valid until its next read.
+    """
+    data_offset = _member_data_offset(raw_file, member, raw_lock)
+    data = memoryview(get_read_buffer(member.compress_size))[:member.compress_size]
+
+    if _use_pread(raw_lock):
+        # preadv fills the buffer with the GIL released and leaves the file position alone
+        count = 0
+        while count < member.compress_size:
+            read = os.preadv(raw_file.fileno(), [data[count:]], data_offset + count)
+            if read == 0:
+                break
+            count += read
+    else:
+        with raw_lock or contextlib.nullcontext():
+            raw_file.seek(data_offset)
+            count = raw_file.readinto(data)
+
+    if count != member.compress_size:
+        raise zipfile.BadZipFile(f"Truncated data for {member.filename}")
+    return data
+
+def copy_stored_member(raw_file, member, target_path, raw_lock=None):
+    """Copy a STORED member into target_path inside the kernel with os.copy_file_range.
 
-        with zipfile.ZipFile(zip_path_str, 'r', allowZip64=True) as zip_ref:
-            with zip_ref.open(member_info['filename']) as source:
-                with open(target_path, 'wb') as target:
-                    while chunk := source.read(16384):
-                        target.write(chunk)
+    Returns False when the filesystem can't do this, so the caller can fall back.
+    """
+    data_offset = _member_data_offset(raw_file, member, raw_lock)
+
+    with open(target_path, 'wb', buffering=0) as target:
+        copied = 0
+        while copied < member.compress_size:
+            try:
+                count = os.copy_file_range(raw_file.fileno(), target.fileno(),
+                                           member.compress_size - copied, data_offset + copied)
+            except OSError as e:
+                if e.errno in COPY_FALLBACK_ERRNOS:
+                    return False
+                raise
+            if count == 0:
+                raise zipfile.BadZipFile(f"Truncated data for {member.filename}")
+            copied += count
+
+    # The zip is deleted after extraction, so keep zipfile's CRC guarantee
+    buf = get_read_buffer(EXTRACT_BUF)
+    view = memoryview(buf)
+    crc = 0
+    with open(target_path, 'rb', buffering=0) as f:
+        while count := f.readinto(buf):
+            crc = zlib.crc32(view[:count], crc)
+    if crc != member.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {member.filename}")
+    return True
+
+def extract_member(zip_ref, member, target_path, raw_file=None, raw_lock=None):
+    """Extract a single member to target_path.
+
+    Small DEFLATE entries are decompressed in one shot with libdeflate when available and
+    STORED entries are copied with os.copy_file_range where supported. raw_lock must be
+    given when raw_file is shared between threads.
+    """
+    if raw_file is not None and not member.flag_bits & 0x1:
+        # Both sizes come from the untrusted central directory and compress_size sizes the read buffer
+        if (DEFLATE_AVAILABLE and member.compress_type == zipfile.ZIP_DEFLATED
+                and 0 < member.file_size < ONESHOT_MAX_SIZE
+                and member.compress_size <= ONESHOT_MAX_SIZE):
+            data = deflate.deflate_decompress(read_member_raw(raw_file, member, raw_lock), member.file_size)
+            if zlib.crc32(data) != member.CRC:
+                raise zipfile.BadZipFile(f"Bad CRC-32 for file {member.filename}")
+            target_path.write_bytes(data)
+            return
+
+        if (COPY_FILE_RANGE_AVAILABLE and member.compress_type == zipfile.ZIP_STORED
+                and member.file_size > 0):
+            if copy_stored_member(raw_file, member, target_path, raw_lock):
+                return
+
+    # Fall back to zipfile's streaming reader for large, stored or encrypted members.
+    # ZipExtFile has no native readinto (it would read() and copy), so pooling a
+    # buffer here saves nothing; copyfileobj's 1 MiB chunks keep allocations rare.
+    with zip_ref.open(member) as source:
+        with open(target_path, 'wb', buffering=EXTRACT_BUF) as target:
+            shutil.copyfileobj(source, target, length=EXTRACT_BUF)
+
+def create_member_dirs(extract_dir, members):
+    """Create every parent directory needed by members up front, once per unique directory."""
+    dirs = {(extract_dir / m.filename).parent for m in members}
+    for d in sorted(dirs, key=lambda p: len(p.parts)):
+        d.mkdir(parents=True, exist_ok=True)
+
+def extract_single_file_from_zip(zip_ref, member, extract_dir, raw_file=None, raw_lock=None):
+    """Extract a single member from an already open zip archive - used for intra-zip parallelization."""
+    def _do_extract():
+        extract_member(zip_ref, member, extract_dir / member.filename, raw_file, raw_lock)
 
     try:
         retry_on_network_error(_do_extract, max_retries=3)
-        return True, member_info['filename'], None
+        return True, member.filename, None
     except Exception as e:
         error_type = "Network error" if is_network_error(e) else "Error"
-        return False, member_info['filename'], f"{error_type}: {str(e)}"
+        return False, member.filename, f"{error_type}: {str(e)}"
+
+def _get_intra_zip_pool(intra_zip_workers):
+    """Return this process's intra-zip thread pool, creating it on first use."""
+    pool_size = min(intra_zip_workers, INTRA_ZIP_MAX_THREADS, multiprocessing.cpu_count())
+    pool = getattr(extract_zip_worker, '_pool', None)
+
+    if pool is None or extract_zip_worker._pool_size != pool_size:
+        if pool is not None:
+            pool.shutdown(wait=False)
+        pool = ThreadPoolExecutor(max_workers=pool_size)
+        extract_zip_worker._pool = pool
+        extract_zip_worker._pool_size = pool_size
+
+    return pool
+
+def _fadvise(fd, advice_name):
+    """Pass an access-pattern hint for the whole file to the kernel where posix_fadvise is supported."""
+    if FADVISE_AVAILABLE:
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice_name))
+        except OSError:
+            pass
+
+@contextlib.contextmanager
+def open_zip_sequential(zip_path):
+    """Open zip_path for one sequential extraction pass.
+
+    The kernel is asked to read ahead aggressively. If extraction fails the zip stays on disk,
+    so its pages are dropped from the page cache rather than left to push out more useful data;
+    a successfully extracted zip is deleted, which frees its pages anyway.
+    """
+    fd = os.open(zip_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    _fadvise(fd, 'POSIX_FADV_SEQUENTIAL')
+
+    with os.fdopen(fd, 'rb', buffering=EXTRACT_BUF) as zip_file:
+        try:
+            yield zip_file
+        except BaseException:
+            _fadvise(fd, 'POSIX_FADV_DONTNEED')
+            raise
+
+def drop_zip_cache(zip_path):
+    """Drop the page cache of an extracted zip that could not be deleted."""
+    if FADVISE_AVAILABLE:
+        try:
+            fd = os.open(zip_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            _fadvise(fd, 'POSIX_FADV_DONTNEED')
+        finally:
+            os.close(fd)
+
+def intra_zip_worthwhile(members):
+    """Decide whether extracting members with threads pays for the thread overhead.
+
+    Many small members parallelize well; a zip dominated by one huge member would leave
+    a single thread doing all the work, however large the archive is.
+    """
+    if len(members) <= INTRA_ZIP_MIN_MEMBERS:
+        return False
+    avg_file_size = sum(m.file_size for m in members) / len(members)
+    return avg_file_size < INTRA_ZIP_MAX_AVG_FILE_SIZE
+
+def _fsync_dir(path):
+    """Flush directory entry changes to disk where the platform allows opening directories."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+@contextlib.contextmanager
+def staged_extract_dir(zip_path, extract_dir):
+    """Yield the directory to extract zip_path into, moved into place as extract_dir on success.
+
+    Members are written to a uniquely named sibling staging directory that is renamed once
+    extraction completes, so an interrupted run never leaves a half-extracted folder under the
+    final name. Staging directories left by an interrupted run are removed by walk_zip_files.
+    If extract_dir already exists, extraction goes straight into it as before.
+    """
+    if extract_dir.exists():
+        yield extract_dir
+        return
+
+    # Like tempfile.mkdtemp, but created with the default mode so the final folder gets
+    # the same permissions as a folder created directly
+    while True:
+        staging_dir = extract_dir.parent / f".{extract_dir.name}.{os.urandom(4).hex()}{STAGING_SUFFIX}"
+        try:
+            staging_dir.mkdir()
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        yield staging_dir
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    os.rename(staging_dir, extract_dir)
+    # Make the rename durable before the caller deletes the zip
+    _fsync_dir(extract_dir.parent)
 
 def extract_zip_worker(zip_path_str, intra_zip_workers=1):
     """Worker function for multiprocessing - extracts a single zip file with optional intra-zip parallelization."""
@@ -179,26 +525,40 @@ def extract_zip_worker(zip_path_str, intra_zip_workers=1):
 
     def _do_extraction():
         """Inner function for retry logic."""
-        extract_dir.mkdir(exist_ok=True)
-
-        with zipfile.ZipFile(zip_path, 'r', allowZip64=True) as zip_ref:
+        # zipfile and the raw member reads share one buffered handle
+        with staged_extract_dir(zip_path, extract_dir) as target_dir, \
+                open_zip_sequential(zip_path) as zip_file, \
+                zipfile.ZipFile(zip_file, 'r', allowZip64=True) as zip_ref:
             members = [m for m in zip_ref.infolist() if not m.is_dir()]
+            create_member_dirs(target_dir, members)
 
-            # For large zip files with many files, use parallel extraction within the zip
-            if len(members) > 20 and intra_zip_workers > 1:
-                member_args = [
-                    (str(zip_path), {'filename': m.filename}, str(extract_dir))
-                    for m in members
-                ]
+            # For zips with many smallish files, use parallel extraction within the zip
+            if intra_zip_workers > 1 and intra_zip_worthwhile(members):
+                # Threads share the open archive; zipfile serializes its own reads, while
+                # the raw reads for the fast paths go through a second handle with pread
+                # (or under raw_lock where pread is unavailable)
+                executor = _get_intra_zip_pool(intra_zip_workers)
+                raw_lock = threading.Lock()
 
                 failed_files = []
-                with ThreadPoolExecutor(max_workers=min(intra_zip_workers, len(members))) as executor:
-                    futures = [executor.submit(extract_single_file_from_zip, args) for args in member_args]
+                with open(zip_path, 'rb', buffering=EXTRACT_BUF) as raw_file:
+                    # Keep a bounded number of members in flight rather than one future per member
+                    window = extract_zip_worker._pool_size * PENDING_FUTURES_PER_WORKER
+                    member_iter = iter(members)
+                    pending = set()
+
+                    for member in itertools.islice(member_iter, window):
+                        pending.add(executor.submit(extract_single_file_from_zip, zip_ref, member, target_dir, raw_file, raw_lock))
+
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            success, filename, error = future.result()
+                            if not success:
+                                failed_files.append((filename, error))
 
-                    for future in as_completed(futures):
-                        success, filename, error = future.result()
-                        if not success:
-                            failed_files.append((filename, error))
+                        for member in itertools.islice(member_iter, len(done)):
+                            pending.add(executor.submit(extract_single_file_from_zip, zip_ref, member, target_dir, raw_file, raw_lock))
 
                 if failed_files:
                     error_msg = f"Failed to extract {len(failed_files)} files: {failed_files[:3]}"
@@ -206,14 +566,7 @@ def extract_zip_worker(zip_path_str, intra_zip_workers=1):
             else:
                 # Sequential extraction for smaller zips
                 for member in members:
-                    source = zip_ref.open(member)
-                    target_path = extract_dir / member.filename
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    with open(target_path, 'wb') as target:
-                        while chunk := source.read(16384):
-                            target.write(chunk)
-                    source.close()
+                    extract_member(zip_ref, member, target_dir / member.filename, zip_file)
 
     try:
         # Retry extraction on network errors
@@ -223,6 +576,7 @@ def extract_zip_worker(zip_path_str, intra_zip_workers=1):
         try:
             retry_on_network_error(lambda: zip_path.unlink(), max_retries=2)
         except Exception as e:
+            drop_zip_cache(zip_path)
             logging.warning(f"Could not delete {zip_path}: {e}. Extraction was successful.")
 
         return True, str(zip_path), None
@@ -246,31 +600,28 @@ def extract_zip(zip_path, progress_tracker=None, progress_callback=None):
         return True
 
     try:
-        logging.info(f"Extracting {zip_path} to {extract_dir}")
+        logging.debug(f"Extracting {zip_path} to {extract_dir}")
 
         if progress_callback:
             progress_callback(f"Extracting {zip_path.name}")
 
-        extract_dir.mkdir(exist_ok=True)
-
-        with zipfile.ZipFile(zip_path, 'r', allowZip64=True) as zip_ref:
-            for member in zip_ref.infolist():
-                if member.is_dir():
-                    continue
-
-                source = zip_ref.open(member)
-                target_path = extract_dir / member.filename
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                with open(target_path, 'wb') as target:
-                    while chunk := source.read(8192):
-                        target.write(chunk)
-                source.close()
+        # zipfile and the raw member reads share one buffered handle
+        with staged_extract_dir(zip_path, extract_dir) as target_dir, \
+                open_zip_sequential(zip_path) as zip_file, \
+                zipfile.ZipFile(zip_file, 'r', allowZip64=True) as zip_ref:
+            members = [m for m in zip_ref.infolist() if not m.is_dir()]
+            create_member_dirs(target_dir, members)
 
-        logging.info(f"Successfully extracted {zip_path} to {extract_dir}")
+            for member in members:
+                extract_member(zip_ref, member, target_dir / member.filename, zip_file)
 
-        zip_path.unlink()
-        logging.info(f"Deleted {zip_path}")
+        try:
+            zip_path.unlink()
+        except OSError:
+            drop_zip_cache(zip_path)
+            raise
+        logging.debug(f"Deleted {zip_path}")
+        logging.info(f"Extracted {zip_path} to {extract_dir} and deleted the zip")
 
         if progress_tracker:
             progress_tracker.mark_processed(zip_path)
@@ -287,33 +638,141 @@ def extract_zip(zip_path, progress_tracker=None, progress_callback=None):
         logging.error(f"Error processing {zip_path}: {e}")
         return False
 
-def analyze_zip_files(zip_files):
-    """Analyze zip files to determine optimal extraction strategy."""
-    file_analysis = []
+def _get_fs_type(directory):
+    """Return the filesystem type of the mount holding directory (Linux only), or None."""
+    try:
+        real_dir = os.path.realpath(directory)
+        best_mount, best_type = '', None
+        with open('/proc/mounts', 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                # /proc/mounts escapes whitespace in mount points as octal
+                mount_point = re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), fields[1])
+                if real_dir == mount_point or real_dir.startswith(mount_point.rstrip('/') + '/'):
+                    if len(mount_point) >= len(best_mount):
+                        best_mount, best_type = mount_point, fields[2]
+        return best_type
+    except OSError:
+        return None
+
+def _is_rotational(directory):
+    """Return True/False if the block device holding directory is/isn't rotational (Linux only), else None."""
+    try:
+        st_dev = os.stat(directory).st_dev
+        dev_path = os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+    except (OSError, AttributeError):
+        return None
 
-    for zip_path in zip_files:
+    # Partitions don't have a queue directory of their own; check the parent disk
+    for candidate in (dev_path, os.path.dirname(dev_path)):
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                file_count = len([m for m in zip_ref.infolist() if not m.is_dir()])
-                zip_size = zip_path.stat().st_size
-                file_analysis.append({
-                    'path': zip_path,
-                    'file_count': file_count,
-                    'size_mb': zip_size / (1024 * 1024),
-                    'avg_file_size': zip_size / max(file_count, 1)
-                })
-        except Exception:
-            file_analysis.append({
-                'path': zip_path,
-                'file_count': 1,
-                'size_mb': 0,
-                'avg_file_size': 0
-            })
-
-    return file_analysis
+            with open(os.path.join(candidate, 'queue', 'rotational'), 'r') as f:
+                return f.read().strip() == '1'
+        except OSError:
+            continue
+    return None
+
+def _probe_io_parallelism(directory):
+    """Suggest how many concurrent extractions the storage under directory can sustain.
+
+    Oversubscribing a disk makes extraction slower, not faster: spinning disks are
+    capped at 4, while network filesystems are latency-bound and allowed 16.
+    """
+    cpu_count = multiprocessing.cpu_count()
+
+    if _get_fs_type(directory) in NETWORK_FS_TYPES:
+        return NETWORK_IO_PARALLELISM
+    if _is_rotational(directory):
+        return min(cpu_count, HDD_IO_PARALLELISM)
+    return min(cpu_count, SSD_IO_PARALLELISM)
+
+def walk_zip_files(directory):
+    """Yield paths of all zip files below directory.
+
+    Uses os.scandir so directory checks come from cached DirEntry data and only
+    matching files are wrapped in Path objects.
+
+    Extraction runs while the walk is still going, so each directory is listed in full before
+    any zip in it is yielded, and the extract target of a yielded zip is never descended into.
+    Folders created by extraction are therefore never scanned and the walk sees the same zips
+    as a listing taken before extraction started.
+    """
+    pending_dirs = [os.fspath(directory)]
+
+    while pending_dirs:
+        current = pending_dirs.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError as e:
+            logging.warning(f"Could not scan {current}: {e}")
+            continue
+
+        zip_entries = []
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if STAGING_DIR_PATTERN.match(entry.name):
+                        # Extraction only stages into directories that were already listed,
+                        # so one seen here was left behind by an interrupted run
+                        logging.info(f"Removing leftover staging directory {entry.path}")
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                    else:
+                        subdirs.append(entry)
+                elif entry.name.endswith('.zip'):
+                    zip_entries.append(entry)
+            except OSError as e:
+                logging.warning(f"Could not scan {entry.path}: {e}")
+
+        extract_targets = {Path(entry.name).stem for entry in zip_entries}
+        pending_dirs.extend(entry.path for entry in subdirs if entry.name not in extract_targets)
+
+        for entry in zip_entries:
+            yield Path(entry.path)
+
+def iter_pending_zips(directory, progress_tracker, scan_stats):
+    """Lazily yield zips below directory that still need extracting, with their sizes.
+
+    Discovery, progress filtering and sizing happen in a single pass, counting found and
+    skipped zips in scan_stats. Archives are not opened here: extract_zip_worker already
+    parses the central directory and decides on intra-zip threading itself.
+    """
+    for zip_path in walk_zip_files(directory):
+        scan_stats['found'] += 1
+        if progress_tracker and progress_tracker.is_processed(zip_path):
+            scan_stats['skipped'] += 1
+            continue
+
+        try:
+            zip_size = os.stat(zip_path).st_size
+        except OSError:
+            zip_size = 0
+        yield {
+            'path': zip_path,
+            'size_mb': zip_size / (1024 * 1024)
+        }
+
+def _log_scan_summary(scan_stats, progress_callback):
+    """Report the scan totals once discovery has finished."""
+    remaining = scan_stats['found'] - scan_stats['skipped']
+
+    if scan_stats['skipped'] > 0:
+        resume_msg = f"Resuming: {scan_stats['skipped']} file(s) already processed, {remaining} remaining"
+        logging.info(resume_msg)
+        if progress_callback:
+            progress_callback(resume_msg)
+
+    logging.info(f"Found {remaining} zip files to process")
 
 def scan_directory(directory, progress_tracker=None, progress_callback=None, stop_event=None, use_multiprocessing=True, max_workers=None, intra_zip_workers=4):
-    """Recursively scan directory for zip files and extract them with intelligent strategy selection."""
+    """Recursively scan directory for zip files and extract them with intelligent strategy selection.
+
+    Zips are found, filtered and sized lazily, so extraction starts as soon as the first
+    zip is found instead of after the whole tree has been walked.
+    """
     directory = Path(directory)
 
     if not directory.exists():
@@ -326,48 +785,36 @@ def scan_directory(directory, progress_tracker=None, progress_callback=None, sto
 
     logging.info(f"Scanning directory: {directory}")
 
+    io_parallelism = _probe_io_parallelism(directory)
+    if max_workers is None:
+        max_workers = io_parallelism
+    intra_zip_workers = min(intra_zip_workers, io_parallelism)
+
     if progress_callback:
         progress_callback("Scanning for zip files...", 0)
 
-    zip_files = list(directory.rglob("*.zip"))
-    total_found = len(zip_files)
-
-    if not zip_files:
-        logging.info("No zip files found")
-        return 0, 0
+    scan_stats = {'found': 0, 'skipped': 0}
+    pending_zips = iter_pending_zips(directory, progress_tracker, scan_stats)
 
-    if progress_tracker:
-        original_count = len(zip_files)
-        zip_files = [zf for zf in zip_files if not progress_tracker.is_processed(zf)]
-        skipped_count = original_count - len(zip_files)
+    # Look ahead two zips: a single zip isn't worth starting a process pool for
+    head = list(itertools.islice(pending_zips, 2))
 
-        if skipped_count > 0:
-            resume_msg = f"Resuming: {skipped_count} file(s) already processed, {len(zip_files)} remaining"
-            logging.info(resume_msg)
-            if progress_callback:
-                progress_callback(resume_msg, 0)
-
-        if not zip_files:
+    if not head:
+        if scan_stats['found'] == 0:
+            logging.info("No zip files found")
+        else:
+            _log_scan_summary(scan_stats, progress_callback)
             logging.info("All zip files already processed")
             if progress_callback:
                 progress_callback("All files already processed!", 100)
-            return 0, 0
-
-    logging.info(f"Found {len(zip_files)} zip files to process")
-
-    if progress_callback:
-        progress_callback(f"Analyzing {len(zip_files)} zip files for optimal extraction...", 0)
-
-    file_analysis = analyze_zip_files(zip_files)
-
-    # Determine extraction strategy based on analysis
-    large_zips = [f for f in file_analysis if f['file_count'] > 20 and f['size_mb'] > 10]
-    small_zips = [f for f in file_analysis if f not in large_zips]
+        return 0, 0
 
-    if not use_multiprocessing or len(zip_files) < 2:
-        return _scan_directory_sequential([f['path'] for f in file_analysis], progress_tracker, progress_callback, stop_event)
+    if not use_multiprocessing or len(head) < 2:
+        zip_files = [f['path'] for f in itertools.chain(head, pending_zips)]
+        _log_scan_summary(scan_stats, progress_callback)
+        return _scan_directory_sequential(zip_files, progress_tracker, progress_callback, stop_event)
     else:
-        return _scan_directory_hybrid(large_zips, small_zips, progress_tracker, progress_callback, stop_event, max_workers, intra_zip_workers)
+        return _scan_directory_hybrid(itertools.chain(head, pending_zips), scan_stats, progress_tracker, progress_callback, stop_event, max_workers, intra_zip_workers)
 
 def _scan_directory_sequential(zip_files, progress_tracker, progress_callback, stop_event):
     """Sequential processing for small numbers of files or when multiprocessing is disabled."""
@@ -410,95 +857,156 @@ def _scan_directory_sequential(zip_files, progress_tracker, progress_callback, s
     logging.info(f"Successfully processed {success_count}/{processed_count} zip files")
     return success_count, processed_count
 
-def _scan_directory_hybrid(large_zips, small_zips, progress_tracker, progress_callback, stop_event, max_workers, intra_zip_workers):
-    """Hybrid extraction strategy: parallel processing with intra-zip parallelization for large files."""
+def _worker_init():
+    """Initializer for extraction worker processes."""
+    # Workers started from a forkserver don't inherit the parent's logging handlers
+    if not logging.getLogger().handlers:
+        setup_logging(buffered=False)
+
+def _get_mp_context():
+    """Return the multiprocessing context used for extraction workers.
+
+    A forkserver (where available) starts workers from a process that has already
+    imported this module, instead of re-importing it per worker or forking the
+    possibly multi-threaded GUI process.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context('forkserver')
+        ctx.set_forkserver_preload(['__main__', __name__])
+        return ctx
+    return multiprocessing.get_context()
+
+def _scan_directory_hybrid(pending_zips, scan_stats, progress_tracker, progress_callback, stop_event, max_workers, intra_zip_workers):
+    """Hybrid extraction strategy: parallel processing with intra-zip parallelization for zips with many files.
+
+    pending_zips is consumed while extraction runs. At most PENDING_FUTURES_PER_WORKER zips per
+    worker are in flight, and up to as many discovered zips wait in a heap so the largest one
+    known is always submitted next (longest-processing-time-first).
+    """
     if max_workers is None:
-        max_workers = min(multiprocessing.cpu_count(), 8)
+        first = next(pending_zips, None)
+        if first is None:
+            return 0, 0
+        pending_zips = itertools.chain([first], pending_zips)
+        max_workers = _probe_io_parallelism(first['path'].parent)
 
     success_count = 0
     processed_count = 0
-    total_files = len(large_zips) + len(small_zips)
     batch_size = 5
+    window = max_workers * PENDING_FUTURES_PER_WORKER
+    type_counts = {'large': 0, 'small': 0}
+
+    discovered = []  # heap of (-size_mb, discovery order, zip_info)
+    discovery_order = itertools.count()
+    scan_done = False
+    pending = {}
 
-    logging.info(f"Hybrid strategy: {len(large_zips)} large zips, {len(small_zips)} small zips")
-    logging.info(f"Using {max_workers} processes, {intra_zip_workers} threads per large zip")
+    logging.info(f"Using {max_workers} processes, up to {intra_zip_workers} threads per zip")
 
     if progress_callback:
-        progress_callback(f"Starting hybrid extraction ({total_files} files, {len(large_zips)} large with {intra_zip_workers} threads each)...", 0)
+        progress_callback(f"Starting hybrid extraction ({max_workers} processes, up to {intra_zip_workers} threads per zip)...", 0)
 
     try:
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
-
-            # Submit large zips with intra-zip parallelization
-            for zip_info in large_zips:
-                future = executor.submit(extract_zip_worker, str(zip_info['path']), intra_zip_workers)
-                futures.append((future, zip_info['path'], zip_info['size_mb'], 'large'))
-
-            # Submit small zips with single-threaded extraction
-            for zip_info in small_zips:
-                future = executor.submit(extract_zip_worker, str(zip_info['path']), 1)
-                futures.append((future, zip_info['path'], zip_info['size_mb'], 'small'))
-
-            for future, zip_path, size_mb, zip_type in futures:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=_get_mp_context(), initializer=_worker_init) as executor:
+            while True:
                 if stop_event and stop_event.is_set():
                     logging.info("Operation cancelled by user")
+                    for future in pending:
+                        future.cancel()
                     break
 
-                try:
-                    success, extracted_path, error = future.result()
-                    processed_count += 1
-                    percentage = int((processed_count / total_files) * 100)
-
-                    if success:
-                        success_count += 1
-                        logging.info(f"Successfully extracted {zip_type} zip: {extracted_path}")
-                        if progress_tracker:
-                            progress_tracker.mark_processed(Path(extracted_path))
+                # Keep discovery a window ahead of submission
+                while not scan_done and len(discovered) < window:
+                    zip_info = next(pending_zips, None)
+                    if zip_info is None:
+                        scan_done = True
+                        _log_scan_summary(scan_stats, progress_callback)
                     else:
-                        error_lower = error.lower() if error else ""
-                        if "network error" in error_lower:
-                            logging.error(f"Network error extracting {zip_type} zip {extracted_path}: {error}")
+                        heapq.heappush(discovered, (-zip_info['size_mb'], next(discovery_order), zip_info))
+
+                while discovered and len(pending) < window:
+                    _, _, zip_info = heapq.heappop(discovered)
+                    # Every zip is offered intra-zip threads; the worker decides from its members
+                    zip_type = 'large' if zip_info['size_mb'] > LARGE_ZIP_MIN_MB else 'small'
+                    type_counts[zip_type] += 1
+                    future = executor.submit(extract_zip_worker, str(zip_info['path']), intra_zip_workers)
+                    pending[future] = (zip_info, zip_type)
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    zip_info, zip_type = pending.pop(future)
+                    zip_path = zip_info['path']
+                    size_mb = zip_info['size_mb']
+
+                    try:
+                        success, extracted_path, error = future.result()
+                        processed_count += 1
+
+                        # The total is only known once the scan has finished
+                        if scan_done:
+                            total_files = scan_stats['found'] - scan_stats['skipped']
+                            progress = f"{processed_count}/{total_files}"
+                            percentage = int((processed_count / total_files) * 100)
+                        else:
+                            progress = f"{processed_count}"
+                            percentage = None
+
+                        if success:
+                            success_count += 1
+                            logging.info(f"Successfully extracted {zip_type} zip: {extracted_path}")
+                            if progress_tracker:
+                                progress_tracker.mark_processed(Path(extracted_path))
+                        else:
+                            error_lower = error.lower() if error else ""
+                            if "network error" in error_lower:
+                                logging.error(f"Network error extracting {zip_type} zip {extracted_path}: {error}")
+                                # Immediately save progress on network errors
+                                if progress_tracker:
+                                    progress_tracker.batch_save_progress()
+                                    logging.info("Progress saved due to network error")
+                            else:
+                                logging.error(f"Failed to extract {zip_type} zip {extracted_path}: {error}")
+
+                        if progress_callback:
+                            progress_callback(f"Processed {progress}: {zip_path.name} ({size_mb:.1f} MB) - {success_count} successful", percentage)
+
+                        if progress_tracker and processed_count % batch_size == 0:
+                            progress_tracker.batch_save_progress()
+
+                    except Exception as e:
+                        processed_count += 1
+                        if is_network_error(e):
+                            logging.error(f"Network error processing {zip_path}: {e}")
                             # Immediately save progress on network errors
                             if progress_tracker:
                                 progress_tracker.batch_save_progress()
                                 logging.info("Progress saved due to network error")
                         else:
-                            logging.error(f"Failed to extract {zip_type} zip {extracted_path}: {error}")
-
-                    if progress_callback:
-                        progress_callback(f"Processed {processed_count}/{total_files}: {zip_path.name} ({size_mb:.1f} MB) - {success_count} successful", percentage)
-
-                    if progress_tracker and processed_count % batch_size == 0:
-                        progress_tracker.batch_save_progress()
-
-                except Exception as e:
-                    processed_count += 1
-                    if is_network_error(e):
-                        logging.error(f"Network error processing {zip_path}: {e}")
-                        # Immediately save progress on network errors
-                        if progress_tracker:
-                            progress_tracker.batch_save_progress()
-                            logging.info("Progress saved due to network error")
-                    else:
-                        logging.error(f"Error processing {zip_path}: {e}")
+                            logging.error(f"Error processing {zip_path}: {e}")
 
     except Exception as e:
         logging.error(f"Error in hybrid processing: {e}")
-        # Fallback to sequential processing
-        all_paths = [z['path'] for z in large_zips + small_zips]
-        return _scan_directory_sequential(all_paths, progress_tracker, progress_callback, stop_event)
+        # Fallback to sequential processing for everything not yet extracted
+        remaining_paths = [zip_info['path'] for zip_info, _ in pending.values()]
+        remaining_paths += [zip_info['path'] for _, _, zip_info in discovered]
+        remaining_paths += [zip_info['path'] for zip_info in pending_zips]
+        return _scan_directory_sequential(remaining_paths, progress_tracker, progress_callback, stop_event)
 
     if progress_tracker:
         progress_tracker.batch_save_progress()
 
+    logging.info(f"Hybrid strategy: {type_counts['large']} large zips, {type_counts['small']} small zips")
     logging.info(f"Successfully processed {success_count}/{processed_count} zip files")
     return success_count, processed_count
 
 def _scan_directory_parallel(zip_files, progress_tracker, progress_callback, stop_event, max_workers):
     """Legacy parallel processing function - kept for compatibility."""
     if max_workers is None:
-        max_workers = min(multiprocessing.cpu_count(), len(zip_files), 8)
+        max_workers = min(_probe_io_parallelism(Path(zip_files[0]).parent), len(zip_files))
 
     success_count = 0
     processed_count = 0
@@ -511,38 +1019,55 @@ def _scan_directory_parallel(zip_files, progress_tracker, progress_callback, sto
         progress_callback(f"Starting parallel extraction with {max_workers} workers ({total_files} files)...", 0)
 
     try:
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            zip_paths_str = [str(zf) for zf in zip_files]
-            future_to_path = {executor.submit(extract_zip_worker, path): path for path in zip_paths_str}
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=_get_mp_context(), initializer=_worker_init) as executor:
+            # Keep at most a window of zips in flight instead of one future per zip
+            window = max_workers * PENDING_FUTURES_PER_WORKER
+            zip_paths = iter([str(zf) for zf in zip_files])
+            future_to_path = {}
 
-            for future in as_completed(future_to_path):
+            def _submit_next():
+                path = next(zip_paths, None)
+                if path is not None:
+                    future_to_path[executor.submit(extract_zip_worker, path)] = path
+
+            for _ in range(window):
+                _submit_next()
+
+            while future_to_path:
                 if stop_event and stop_event.is_set():
                     logging.info("Operation cancelled by user")
+                    for future in future_to_path:
+                        future.cancel()
                     break
 
-                path = future_to_path[future]
-                try:
-                    success, zip_path, error = future.result()
-                    processed_count += 1
-                    percentage = int((processed_count / total_files) * 100)
-
-                    if success:
-                        success_count += 1
-                        logging.info(f"Successfully extracted: {zip_path}")
-                        if progress_tracker:
-                            progress_tracker.mark_processed(Path(zip_path))
-                    else:
-                        logging.error(f"Failed to extract {zip_path}: {error}")
+                done, _ = wait(future_to_path, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    path = future_to_path.pop(future)
+                    _submit_next()
 
-                    if progress_callback:
-                        progress_callback(f"Processed {processed_count}/{total_files}: {Path(zip_path).name} - {success_count} successful", percentage)
+                    try:
+                        success, zip_path, error = future.result()
+                        processed_count += 1
+                        percentage = int((processed_count / total_files) * 100)
 
-                    if progress_tracker and processed_count % batch_size == 0:
-                        progress_tracker.batch_save_progress()
+                        if success:
+                            success_count += 1
+                            logging.info(f"Successfully extracted: {zip_path}")
+                            if progress_tracker:
+                                progress_tracker.mark_processed(Path(zip_path))
+                        else:
+                            logging.error(f"Failed to extract {zip_path}: {error}")
+
+                        if progress_callback:
+                            progress_callback(f"Processed {processed_count}/{total_files}: {Path(zip_path).name} - {success_count} successful", percentage)
+
+                        if progress_tracker and processed_count % batch_size == 0:
+                            progress_tracker.batch_save_progress()
 
-                except Exception as e:
-                    processed_count += 1
-                    logging.error(f"Error processing {path}: {e}")
+                    except Exception as e:
+                        processed_count += 1
+                        logging.error(f"Error processing {path}: {e}")
 
     except Exception as e:
         logging.error(f"Error in parallel processing: {e}")
@@ -604,8 +1129,11 @@ class ZipZapGUI:
         worker_frame = ttk.Frame(main_frame)
         worker_frame.grid(row=2, column=0, sticky=tk.E, pady=(10, 0))
 
-        self.workers_var = tk.StringVar(value=str(min(multiprocessing.cpu_count(), 8)))
-        worker_spinbox = ttk.Spinbox(worker_frame, from_=1, to=multiprocessing.cpu_count(),
+        # "Auto" lets scan_directory size the pool from the storage probe; picking a directory
+        # shows the probed value, which is still treated as auto until the user changes it
+        self.workers_var = tk.StringVar(value="Auto")
+        self.suggested_workers = None
+        worker_spinbox = ttk.Spinbox(worker_frame, from_=1, to=max(multiprocessing.cpu_count(), NETWORK_IO_PARALLELISM),
                                    textvariable=self.workers_var, width=5)
         worker_spinbox.grid(row=0, column=0, padx=5)
 
@@ -651,6 +1179,9 @@ class ZipZapGUI:
         directory = filedialog.askdirectory()
         if directory:
             self.directory_var.set(directory)
+            if self.workers_var.get() in ("Auto", str(self.suggested_workers)):
+                self.suggested_workers = _probe_io_parallelism(directory)
+                self.workers_var.set(str(self.suggested_workers))
     
     def start_extraction(self):
         directory = self.directory_var.get()
@@ -670,8 +1201,9 @@ class ZipZapGUI:
         self.progress_bar['value'] = 0
 
         # Show progress tracking status
-        if self.progress_tracker.processed_files:
-            self.update_progress(f"Progress tracking active: {len(self.progress_tracker.processed_files)} files already processed", 0)
+        processed_count = self.progress_tracker.processed_count()
+        if processed_count:
+            self.update_progress(f"Progress tracking active: {processed_count} files already processed", 0)
         else:
             self.update_progress("Starting fresh extraction (progress tracking enabled)", 0)
 
@@ -692,7 +1224,9 @@ class ZipZapGUI:
                 try:
                     max_workers = int(self.workers_var.get())
                 except ValueError:
-                    max_workers = min(multiprocessing.cpu_count(), 8)
+                    max_workers = None
+                if max_workers == self.suggested_workers:
+                    max_workers = None
 
                 try:
                     intra_zip_workers = int(self.intra_zip_var.get())